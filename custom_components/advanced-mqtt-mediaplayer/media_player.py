@@ -1,18 +1,11 @@
 import logging
-import homeassistant.loader as loader
 import hashlib
 import voluptuous as vol
 import base64
-import requests
-import math
 import homeassistant.helpers.config_validation as cv
 
 from urllib.parse import urlparse
-from typing import Optional
 from homeassistant.util import dt
-from homeassistant.exceptions import TemplateError, NoEntitySpecifiedError
-from homeassistant.helpers.script import Script
-from homeassistant.helpers.event import TrackTemplate, async_track_template_result, async_track_state_change
 from homeassistant.components import mqtt
 from homeassistant.components.media_player import PLATFORM_SCHEMA, MediaPlayerEntity
 from homeassistant.components.media_player.const import (
@@ -423,6 +416,9 @@ class AdvancedMQTTMediaPlayer(MediaPlayerEntity):
         _parsed = urlparse(_image)
 
         if _parsed.path != _image:
+            # requests is slow to import, only load it for the first cover url
+            import requests
+
             _image = base64.b64encode(requests.get(_image).content)
 
         if len(_image) > 0:
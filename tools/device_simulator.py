@@ -0,0 +1,259 @@
+"""Simulated MQTT media players and command latency load test.
+
+Each simulated player subscribes to the ``set`` topics the component publishes
+to, applies the command after a configurable delay and jitter and echoes the
+result on the matching ``stat`` topic, like a real device would.
+
+Usage:
+    python tools/device_simulator.py config --players 10
+    python tools/device_simulator.py simulate --players 10 --delay 50 --jitter 20
+    python tools/device_simulator.py load --players 10 --rounds 20 --token TOKEN
+
+``config`` prints the Home Assistant configuration matching the simulated
+topic layout, ``simulate`` runs the players against a broker (e.g. a local
+mosquitto) and ``load`` drives the players through Home Assistant service
+calls and reports command-to-confirmed-state latency percentiles and message
+amplification.
+"""
+import argparse
+import json
+import random
+import statistics
+import threading
+import time
+import urllib.request
+
+import paho.mqtt.client as mqtt
+
+STAT_TOPIC = "stat"
+SET_TOPIC = "set"
+
+SOURCE_LIST = ["TV", "Radio", "Bluetooth"]
+
+# Service call used by the load test, the set topic it publishes to and the
+# payload the device echoes on the stat topic once the command is applied.
+COMMANDS = {
+    "media_play": ("state", lambda: {}, lambda data: "playing"),
+    "media_pause": ("state", lambda: {}, lambda data: "paused"),
+    "volume_set": (
+        "volume",
+        lambda: {"volume_level": round(random.randint(1, 100) / 100.0, 2)},
+        lambda data: str(int(data["volume_level"] * 100)),
+    ),
+    "select_source": (
+        "source",
+        lambda: {"source": random.choice(SOURCE_LIST)},
+        lambda data: data["source"],
+    ),
+}
+
+
+def topic(prefix, player, action, kind):
+    return "{}/{}/{}/{}".format(prefix, player, action, kind)
+
+
+def entity_id(player):
+    return "media_player.sim_player_{}".format(player)
+
+
+def new_client(client_id):
+    if hasattr(mqtt, "CallbackAPIVersion"):
+        return mqtt.Client(mqtt.CallbackAPIVersion.VERSION1, client_id=client_id)
+
+    return mqtt.Client(client_id=client_id)
+
+
+def print_config(args):
+    print("media_player:")
+    for player in range(args.players):
+        def t(action, kind):
+            return topic(args.prefix, player, action, kind)
+
+        print("  - platform: advanced-mqtt-mediaplayer")
+        print("    name: sim_player_{}".format(player))
+        print("    actions:")
+        print("      state: {{stat: {}, set: {}}}".format(t("state", STAT_TOPIC), t("state", SET_TOPIC)))
+        print("      title: {{stat: {}}}".format(t("title", STAT_TOPIC)))
+        print("      volume: {{stat: {}, set: {}}}".format(t("volume", STAT_TOPIC), t("volume", SET_TOPIC)))
+        print("      volume_up: {{set: {}}}".format(t("volume_up", SET_TOPIC)))
+        print("      volume_down: {{set: {}}}".format(t("volume_down", SET_TOPIC)))
+        print("      mute: {{stat: {}, set: {}}}".format(t("mute", STAT_TOPIC), t("mute", SET_TOPIC)))
+        print("      source:")
+        print("        stat: {}".format(t("source", STAT_TOPIC)))
+        print("        set: {}".format(t("source", SET_TOPIC)))
+        print("        source_list: [{}]".format(", ".join(SOURCE_LIST)))
+
+
+class SimulatedPlayer:
+
+    def __init__(self, client, prefix, player, delay, jitter):
+        self._client = client
+        self._prefix = prefix
+        self._player = player
+        self._delay = delay
+        self._jitter = jitter
+        self._volume = 50
+
+    def subscribe(self):
+        self._client.subscribe(topic(self._prefix, self._player, "+", SET_TOPIC))
+
+    def handle(self, action, payload):
+        _wait = max(0.0, self._delay + random.uniform(-self._jitter, self._jitter))
+        threading.Timer(_wait / 1000.0, self.apply, (action, payload)).start()
+
+    def apply(self, action, payload):
+        if action == "volume_up":
+            action, payload = "volume", str(min(100, self._volume + 1))
+        elif action == "volume_down":
+            action, payload = "volume", str(max(0, self._volume - 1))
+
+        if action == "volume":
+            self._volume = int(float(payload))
+        elif action in ("next", "prev", "seek"):
+            return
+
+        self._client.publish(topic(self._prefix, self._player, action, STAT_TOPIC), payload, retain=True)
+
+
+def simulate(args):
+    client = new_client("advanced-mqtt-mediaplayer-simulator")
+    players = [SimulatedPlayer(client, args.prefix, player, args.delay, args.jitter) for player in range(args.players)]
+
+    def on_connect(client, userdata, flags, rc):
+        for player in players:
+            player.subscribe()
+            client.publish(topic(args.prefix, player._player, "title", STAT_TOPIC), "Simulated", retain=True)
+
+    def on_message(client, userdata, msg):
+        _, player, action, _ = msg.topic.rsplit("/", 3)
+        players[int(player)].handle(action, msg.payload.decode())
+
+    client.on_connect = on_connect
+    client.on_message = on_message
+    client.connect(args.host, args.port)
+    client.loop_forever()
+
+
+def call_service(args, service, data):
+    request = urllib.request.Request(
+        "{}/api/services/media_player/{}".format(args.url.rstrip("/"), service),
+        data=json.dumps(data).encode(),
+        headers={"Authorization": "Bearer {}".format(args.token), "Content-Type": "application/json"},
+        method="POST",
+    )
+    urllib.request.urlopen(request, timeout=args.timeout).read()
+
+
+def percentile(values, percent):
+    if not values:
+        return float("nan")
+
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(percent / 100.0 * (len(values) - 1))))]
+
+
+def load(args):
+    lock = threading.Condition()
+    counts = {SET_TOPIC: 0, STAT_TOPIC: 0}
+    pending = {}
+    latencies = {service: [] for service in COMMANDS}
+
+    def on_message(client, userdata, msg):
+        _, player, action, kind = msg.topic.rsplit("/", 3)
+
+        with lock:
+            if msg.retain:
+                return
+
+            counts[kind] = counts.get(kind, 0) + 1
+
+            _key = (int(player), action)
+            _expected = pending.get(_key)
+            if kind == STAT_TOPIC and _expected is not None and _expected[1] == msg.payload.decode():
+                latencies[_expected[2]].append((time.monotonic() - _expected[0]) * 1000.0)
+                del pending[_key]
+                lock.notify_all()
+
+    client = new_client("advanced-mqtt-mediaplayer-load")
+    client.on_message = on_message
+    client.connect(args.host, args.port)
+    client.subscribe(topic(args.prefix, "+", "+", "+"))
+    client.loop_start()
+
+    calls = 0
+    timeouts = 0
+
+    try:
+        for _ in range(args.rounds):
+            for service, (action, make_data, expected) in COMMANDS.items():
+                for player in range(args.players):
+                    data = make_data()
+                    data["entity_id"] = entity_id(player)
+
+                    with lock:
+                        pending[(player, action)] = (time.monotonic(), expected(data), service)
+
+                    call_service(args, service, data)
+                    calls += 1
+
+                with lock:
+                    if not lock.wait_for(lambda: not pending, timeout=args.timeout):
+                        timeouts += len(pending)
+                        pending.clear()
+    finally:
+        client.loop_stop()
+        client.disconnect()
+
+    print("{:<15}{:>8}{:>10}{:>10}{:>10}{:>10}".format("service", "count", "p50 ms", "p90 ms", "p99 ms", "max ms"))
+    for service, values in latencies.items():
+        print("{:<15}{:>8}{:>10.1f}{:>10.1f}{:>10.1f}{:>10.1f}".format(
+            service,
+            len(values),
+            statistics.median(values) if values else float("nan"),
+            percentile(values, 90),
+            percentile(values, 99),
+            max(values) if values else float("nan"),
+        ))
+
+    print("service calls: {}, timeouts: {}".format(calls, timeouts))
+    print("set messages: {}, stat messages: {}".format(counts[SET_TOPIC], counts[STAT_TOPIC]))
+    if calls:
+        print("amplification: {:.2f} messages per service call".format(
+            (counts[SET_TOPIC] + counts[STAT_TOPIC]) / calls
+        ))
+
+
+def main():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--host", default="localhost", help="MQTT broker host")
+    common.add_argument("--port", type=int, default=1883, help="MQTT broker port")
+    common.add_argument("--prefix", default="sim", help="topic prefix of the simulated players")
+    common.add_argument("--players", type=int, default=1, help="number of simulated players")
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("config", parents=[common], help="print the matching Home Assistant configuration")
+
+    _simulate = subparsers.add_parser("simulate", parents=[common], help="run the simulated players")
+    _simulate.add_argument("--delay", type=float, default=0.0, help="command delay in ms")
+    _simulate.add_argument("--jitter", type=float, default=0.0, help="command jitter in ms")
+
+    _load = subparsers.add_parser("load", parents=[common], help="drive the players through Home Assistant")
+    _load.add_argument("--url", default="http://localhost:8123", help="Home Assistant URL")
+    _load.add_argument("--token", required=True, help="Home Assistant long-lived access token")
+    _load.add_argument("--rounds", type=int, default=10, help="commands per service and player")
+    _load.add_argument("--timeout", type=float, default=5.0, help="confirmation timeout in seconds")
+
+    args = parser.parse_args()
+
+    if args.command == "config":
+        print_config(args)
+    elif args.command == "simulate":
+        simulate(args)
+    else:
+        load(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Import and setup time benchmark for the media player platform.
+
+Every run uses a fresh interpreter. The Home Assistant modules the platform
+shares with the rest of Home Assistant are imported first, so the import time
+only covers what the platform itself adds. The setup time covers validating a
+full platform configuration against PLATFORM_SCHEMA.
+
+Usage:
+    python tools/startup_benchmark.py --runs 20 --import-budget 15 --setup-budget 5
+
+Exits with status 1 when the median import or setup time exceeds its budget.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULE = "custom_components.advanced-mqtt-mediaplayer.media_player"
+
+SNIPPET = """
+import importlib
+import json
+import sys
+import time
+
+import homeassistant.helpers.config_validation
+import homeassistant.components.mqtt
+import homeassistant.components.media_player
+
+_start = time.perf_counter()
+module = importlib.import_module({module!r})
+_imported = time.perf_counter()
+
+config = {{"platform": "advanced-mqtt-mediaplayer", "name": "benchmark", "actions": {{}}}}
+for action in ("state", "volume", "mute", "source"):
+    config["actions"][action] = {{"stat": "bench/" + action + "/stat", "set": "bench/" + action + "/set"}}
+for action in ("title", "artist", "album", "cover", "duration", "position"):
+    config["actions"][action] = {{"stat": "bench/" + action + "/stat"}}
+for action in ("volume_up", "volume_down", "next", "prev", "stop", "seek"):
+    config["actions"][action] = {{"set": "bench/" + action + "/set"}}
+
+_setup = time.perf_counter()
+module.PLATFORM_SCHEMA(config)
+_validated = time.perf_counter()
+
+print(json.dumps({{
+    "import": (_imported - _start) * 1000.0,
+    "setup": (_validated - _setup) * 1000.0,
+    "requests": "requests" in sys.modules,
+}}))
+"""
+
+
+def run_once():
+    output = subprocess.run(
+        [sys.executable, "-c", SNIPPET.format(module=MODULE)],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh interpreter runs")
+    parser.add_argument("--import-budget", type=float, default=15.0, help="median import time budget in ms")
+    parser.add_argument("--setup-budget", type=float, default=5.0, help="median setup time budget in ms")
+    args = parser.parse_args()
+
+    results = [run_once() for _ in range(args.runs)]
+
+    _import = statistics.median(result["import"] for result in results)
+    _setup = statistics.median(result["setup"] for result in results)
+
+    print("import: median {:.2f} ms, min {:.2f} ms (budget {:.2f} ms)".format(
+        _import, min(result["import"] for result in results), args.import_budget
+    ))
+    print("setup:  median {:.2f} ms, min {:.2f} ms (budget {:.2f} ms)".format(
+        _setup, min(result["setup"] for result in results), args.setup_budget
+    ))
+    print("requests imported at startup: {}".format(results[-1]["requests"]))
+
+    if _import > args.import_budget or _setup > args.setup_budget:
+        print("over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()